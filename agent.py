@@ -2,6 +2,7 @@ from unittest import result
 from tools import retrieve_context
 from langchain.agents import create_agent
 from langchain.chat_models import init_chat_model
+from langchain_core.messages import AIMessageChunk
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -27,4 +28,15 @@ def run_agent(query: str):
 
     agent_response = result['messages'][-1].content
 
-    return agent_response
\ No newline at end of file
+    return agent_response
+
+
+def stream_agent(query: str):
+    """Yield the agent response token by token as the model produces it."""
+    for token, metadata in agent.stream(
+        {"messages": [{"role": "user", "content": query}]},
+        stream_mode="messages",
+    ):
+        # Only stream what the model writes, not tool calls or tool output
+        if metadata.get("langgraph_node") == "model" and isinstance(token, AIMessageChunk) and token.text:
+            yield token.text
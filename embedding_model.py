@@ -0,0 +1,59 @@
+"""
+Embedding model shared by ingestion (load_chunk_embed_ingest.py) and retrieval (tools.py).
+Documents and queries must be embedded with the same model, so it is chosen in one place.
+
+By default chunks are embedded with OpenAI's text-embedding-3-small. Set LOCAL_EMBED=true
+to embed on-device with a sentence-transformers model instead, which avoids OpenAI rate
+limits on large ingests (requires the langchain-huggingface package).
+"""
+
+import os
+from dotenv import load_dotenv
+
+from langchain_core.embeddings import Embeddings
+from langchain_openai import OpenAIEmbeddings
+
+# Load environment variables
+load_dotenv()
+
+LOCAL_EMBED = os.getenv("LOCAL_EMBED", "").lower() in {"1", "true", "yes"}
+
+OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
+LOCAL_EMBEDDING_MODEL = "BAAI/bge-small-en-v1.5"
+
+# Vector size of the selected model; pgvector can only index fixed-size columns
+EMBEDDING_DIMENSIONS = 384 if LOCAL_EMBED else 1536
+
+
+def get_embeddings() -> Embeddings:
+    """
+    Create the configured embedding model.
+
+    Returns:
+        OpenAIEmbeddings, or HuggingFaceEmbeddings when LOCAL_EMBED is set
+    """
+    if not LOCAL_EMBED:
+        # Batches up to 256 texts per request, retries on rate limits
+        return OpenAIEmbeddings(model=OPENAI_EMBEDDING_MODEL, chunk_size=256, max_retries=6)
+
+    try:
+        import torch
+        from langchain_huggingface import HuggingFaceEmbeddings
+    except ImportError as e:
+        raise ImportError(
+            "LOCAL_EMBED requires langchain-huggingface: pip install langchain-huggingface"
+        ) from e
+
+    if torch.cuda.is_available():
+        # FP16 halves memory traffic and runs on tensor cores
+        model_kwargs = {"device": "cuda", "model_kwargs": {"torch_dtype": torch.float16}}
+    elif torch.backends.mps.is_available():
+        model_kwargs = {"device": "mps"}
+    else:
+        model_kwargs = {"device": "cpu"}
+
+    return HuggingFaceEmbeddings(
+        model_name=LOCAL_EMBEDDING_MODEL,
+        model_kwargs=model_kwargs,
+        encode_kwargs={"batch_size": 256, "normalize_embeddings": True},
+    )
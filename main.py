@@ -1,12 +1,10 @@
-import time
-from agent import run_agent
+from agent import stream_agent
 
 
-def stream_response(agent_response: str):
-    """Stream the agent response character by character for better UX."""
-    for char in agent_response:
-        print(char, end='', flush=True)
-        time.sleep(0.02)
+def stream_response(tokens):
+    """Print the agent response as tokens arrive from the model."""
+    for token in tokens:
+        print(token, end='', flush=True)
     print()  # Add newline at the end
 
 
@@ -33,8 +31,7 @@ def main():
         # Get agent response
         print("\nAgent: ", end='', flush=True)
         try:
-            agent_response = run_agent(user_query)
-            stream_response(agent_response)
+            stream_response(stream_agent(user_query))
         except Exception as e:
             print(f"\nError: {str(e)}")
         
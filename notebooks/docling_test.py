@@ -3,15 +3,27 @@ Professional Document Processing Pipeline with Docling
 Handles text documents (PDF, DOCX, MD) and audio files (MP3, WAV, M4A, FLAC)
 """
 
+import os
+
+# Give Docling's torch/onnx models the whole machine unless the user pinned it.
+# Must be set before the ML libraries are imported.
+os.environ.setdefault("OMP_NUM_THREADS", str(os.cpu_count() or 1))
+
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
-from docling.document_converter import DocumentConverter, AudioFormatOption
-from docling.datamodel.pipeline_options import AsrPipelineOptions
+from docling.document_converter import DocumentConverter, AudioFormatOption, PdfFormatOption
+from docling.datamodel.pipeline_options import (
+    AcceleratorDevice,
+    AcceleratorOptions,
+    AsrPipelineOptions,
+    PdfPipelineOptions,
+)
 from docling.datamodel import asr_model_specs
 from docling.datamodel.base_models import InputFormat
+from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
 from docling.pipeline.asr_pipeline import AsrPipeline
 
 
@@ -43,6 +55,7 @@ class DocumentProcessor:
     
     Attributes:
         output_dir: Directory where processed markdown files will be saved
+        fast: Whether PDFs are parsed with the faster, lighter pypdfium backend
         audio_extensions: Set of supported audio file extensions
         text_converter: Lazy-loaded text document converter
         audio_converter: Lazy-loaded audio document converter
@@ -50,14 +63,17 @@ class DocumentProcessor:
     
     AUDIO_EXTENSIONS = {'.mp3', '.wav', '.m4a', '.flac'}
     
-    def __init__(self, output_dir: Union[str, Path]):
+    def __init__(self, output_dir: Union[str, Path], fast: bool = True):
         """
         Initialize the document processor.
         
         Args:
             output_dir: Directory path for saving processed documents
+            fast: Parse PDFs with pypdfium (~2x faster, less memory) instead of
+                docling-parse (more accurate tables)
         """
         self.output_dir = Path(output_dir)
+        self.fast = fast
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         # Lazy initialization of converters
@@ -68,7 +84,22 @@ class DocumentProcessor:
     def text_converter(self) -> DocumentConverter:
         """Lazy-load text document converter"""
         if self._text_converter is None:
-            self._text_converter = DocumentConverter()
+            # Use CUDA/MPS for layout, table and OCR models when available
+            pipeline_options = PdfPipelineOptions()
+            pipeline_options.accelerator_options = AcceleratorOptions(
+                num_threads=os.cpu_count() or 1,
+                device=AcceleratorDevice.AUTO,
+            )
+            
+            pdf_format_option = (
+                PdfFormatOption(pipeline_options=pipeline_options, backend=PyPdfiumDocumentBackend)
+                if self.fast
+                else PdfFormatOption(pipeline_options=pipeline_options)
+            )
+            
+            self._text_converter = DocumentConverter(
+                format_options={InputFormat.PDF: pdf_format_option}
+            )
         return self._text_converter
     
     @property
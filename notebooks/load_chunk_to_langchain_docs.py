@@ -4,6 +4,11 @@ Handles text documents (PDF, DOCX, MD, HTML, TXT) and audio files (MP3, WAV)
 Converts to markdown → chunks → returns LangChain Document objects
 """
 
+import os
+
+# Let the Rust tokenizer spread batched calls over all cores
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
 from pathlib import Path
 from typing import List, Optional, Union
 from dataclasses import dataclass
@@ -96,7 +101,10 @@ class UnifiedDocumentProcessor:
         """Lazy-load tokenizer"""
         if self._tokenizer is None:
             print(f"Initializing tokenizer ({self.tokenizer_model})...")
-            self._tokenizer = AutoTokenizer.from_pretrained(self.tokenizer_model)
+            self._tokenizer = AutoTokenizer.from_pretrained(self.tokenizer_model, use_fast=True)
+            # A slow Python tokenizer would quietly dominate chunking time
+            if not self._tokenizer.is_fast:
+                raise ValueError(f"No fast (Rust) tokenizer available for {self.tokenizer_model}")
         return self._tokenizer
     
     @property
@@ -0,0 +1,67 @@
+"""
+PostgreSQL settings shared by ingestion (load_chunk_embed_ingest.py) and retrieval (tools.py).
+Values are read from the environment once and validated up front, so a missing or malformed
+variable fails at startup instead of deep inside psycopg after documents were converted.
+"""
+
+import os
+from dataclasses import dataclass
+from urllib.parse import quote
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+
+@dataclass(frozen=True)
+class PgConf:
+    """Connection settings for the pgvector database"""
+    user: str
+    password: str
+    db: str
+    port: int
+    host: str = "localhost"
+
+    @classmethod
+    def from_env(cls) -> "PgConf":
+        """
+        Build the config from POSTGRES_* environment variables.
+
+        Returns:
+            Validated PgConf
+
+        Raises:
+            ValueError: If a required variable is missing or POSTGRES_PORT is not a valid port
+        """
+        names = ["POSTGRES_USER", "POSTGRES_PASSWORD", "POSTGRES_DB", "POSTGRES_PORT"]
+        missing = [name for name in names if not os.getenv(name)]
+        if missing:
+            raise ValueError(f"Missing PostgreSQL settings: {', '.join(missing)} (see .env.example)")
+
+        port = os.environ["POSTGRES_PORT"]
+        if not port.isdigit() or not 0 < int(port) < 65536:
+            raise ValueError(f"POSTGRES_PORT must be a port number, got {port!r}")
+
+        return cls(
+            user=os.environ["POSTGRES_USER"],
+            password=os.environ["POSTGRES_PASSWORD"],
+            db=os.environ["POSTGRES_DB"],
+            port=int(port),
+        )
+
+    @property
+    def dsn(self) -> str:
+        """Plain libpq DSN for direct psycopg connections"""
+        # Percent-encode everything (libpq does not read '+' as a space)
+        user, password, db = (quote(value, safe="") for value in (self.user, self.password, self.db))
+        return f"postgresql://{user}:{password}@{self.host}:{self.port}/{db}"
+
+    @property
+    def sqlalchemy_url(self) -> str:
+        """SQLAlchemy URL (psycopg 3 driver) used by PGVector"""
+        return self.dsn.replace("postgresql://", "postgresql+psycopg://", 1)
+
+
+# Validated once at import; every connection string is derived from this
+PG_CONF = PgConf.from_env()